@@ -3,15 +3,26 @@ import os
 import sys
 import json
 import time
+import ssl
 import base64
+import importlib
 import psutil
 import urllib3
 import requests
 import websocket
 import threading
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Any, Optional
 
+# Prefer orjson for decoding websocket events when it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 # Setup logging
 logging.basicConfig(
     level=logging.WARNING,
@@ -29,6 +40,149 @@ for handler in logger.handlers:
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Static LCU request headers; the Authorization entry is merged in per connection
+LCU_HEADERS_TEMPLATE = {
+    'Content-Type': 'application/json',
+    'Accept': 'application/json'
+}
+
+CHAMP_SELECT_SESSION_URI = '/lol-champ-select/v1/session'
+
+# Websocket subscription to all LCU JSON API events, serialized once
+WS_SUBSCRIBE_MESSAGE = json.dumps([5, 'OnJsonApiEvent'])
+
+# Trailing-edge window for coalescing champ select session updates
+WS_DEBOUNCE_SECONDS = 0.2
+
+# Upper bound on remembered champ select action IDs in case a reset event is missed
+MAX_PROCESSED_ACTIONS = 64
+
+# Rune path mappings
+PATH_ID_MAP = {
+    "Precision": 8000,
+    "Domination": 8100,
+    "Sorcery": 8200,
+    "Inspiration": 8300,
+    "Resolve": 8400
+}
+
+# Simplified rune map
+RUNE_ID_MAP = {
+    # Precision
+    "Press the Attack": 8005,
+    "Lethal Tempo": 8008,
+    "Fleet Footwork": 8021,
+    "Conqueror": 8010,
+    "Absorb Life": 9101,
+    "Triumph": 9111,
+    "Presence of Mind": 8009,
+    "Legend: Alacrity": 9104,
+    "Legend: Haste": 9105,
+    "Legend: Bloodline": 9103,
+    "Coup de Grace": 8014,
+    "Cut Down": 8017,
+    "Last Stand": 8299,
+
+    # Domination
+    "Electrocute": 8112,
+    "Predator": 8124,
+    "Dark Harvest": 8128,
+    "Hail of Blades": 9923,
+    "Cheap Shot": 8126,
+    "Taste of Blood": 8139,
+    "Sudden Impact": 8143,
+    "Sixth Sense": 8137,
+    "Grisly Mementos": 8140,
+    "Deep Ward": 8141,
+    "Treasure Hunter": 8135,
+    "Relentless Hunter": 8105,
+    "Ultimate Hunter": 8106,
+
+    # Sorcery
+    "Summon Aery": 8214,
+    "Arcane Comet": 8229,
+    "Phase Rush": 8230,
+    "Axiom Arcanist": 8224,
+    "Manaflow Band": 8226,
+    "Nimbus Cloak": 8275,
+    "Transcendence": 8210,
+    "Celerity": 8234,
+    "Absolute Focus": 8233,
+    "Scorch": 8237,
+    "Waterwalking": 8232,
+    "Gathering Storm": 8236,
+
+    # Resolve
+    "Grasp of the Undying": 8437,
+    "Aftershock": 8439,
+    "Guardian": 8465,
+    "Demolish": 8446,
+    "Font of Life": 8463,
+    "Shield Bash": 8401,
+    "Conditioning": 8429,
+    "Second Wind": 8444,
+    "Bone Plating": 8473,
+    "Overgrowth": 8451,
+    "Revitalize": 8453,
+    "Unflinching": 8242,
+
+    # Inspiration
+    "Glacial Augment": 8351,
+    "Unsealed Spellbook": 8360,
+    "First Strike": 8369,
+    "Hextech Flashtraption": 8306,
+    "Magical Footwear": 8304,
+    "Cash Back": 8321,
+    "Triple Tonic": 8313,
+    "Time Warp Tonic": 8352,
+    "Biscuit Delivery": 8345,
+    "Cosmic Insight": 8347,
+    "Approach Velocity": 8410,
+    "Jack Of All Trades": 8316,
+
+    # Stat shards
+    "Adaptive Force": 5008,
+    "Attack Speed": 5005,
+    "Ability Haste": 5007,
+    "Move Speed": 5010,
+    "Tenacity and Slow Resist": 5013,
+    "Health": 5011,
+    "Health Scaling": 5001
+}
+
+# Lowercased index for case-insensitive and fuzzy rune lookups
+RUNE_ID_MAP_LOWER = {name.lower(): rune_id for name, rune_id in RUNE_ID_MAP.items()}
+RUNE_LOWER_ITEMS = tuple(RUNE_ID_MAP_LOWER.items())
+
+# Inverted index of rune name words to the rune IDs containing them
+TOKEN_INDEX: Dict[str, List[int]] = {}
+for _name, _rune_id in RUNE_ID_MAP.items():
+    for _token in _name.lower().split():
+        TOKEN_INDEX.setdefault(_token, []).append(_rune_id)
+
+# Parsed rune_data.json, reused while the file's mtime and size are unchanged
+_RUNE_JSON_CACHE: Dict[str, Any] = {}
+
+def read_rune_data_file(path: str = "rune_data.json") -> tuple:
+    """Return (file key, parsed JSON) for the scraper output, re-reading only when it changes"""
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    if _RUNE_JSON_CACHE.get("key") != key:
+        with open(path, "rb") as f:
+            _RUNE_JSON_CACHE["data"] = json_loads(f.read())
+        _RUNE_JSON_CACHE["key"] = key
+    return key, _RUNE_JSON_CACHE["data"]
+
+class LCUAdapter(HTTPAdapter):
+    """HTTPS adapter that hands every pooled connection the same unverified SSL context"""
+    
+    # The LCU uses a self-signed certificate, so one context without verification is shared
+    ssl_context = ssl._create_unverified_context()
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
 class LCUConnection:
     """Handles connection to the League Client Update (LCU) API"""
     
@@ -37,10 +191,29 @@ class LCUConnection:
         self.port = None
         self.process = None
         self.headers = None
+        self.ws_headers = None
+        self.auth_bytes = None
         self.base_url = None
         self.ws = None
         self.connected = False
         self.ws_connected = False
+        self.session = self._create_session()
+        self.disconnect_listeners: List[threading.Event] = []
+        self._pid = None
+        self._cmdline_parsed = None  # (pid, auth token, port) of the last parsed client
+    
+    def _notify_disconnect(self):
+        """Wake every thread waiting on a connection change"""
+        for event in list(self.disconnect_listeners):
+            event.set()
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a pooled HTTP session so LCU calls reuse the same TLS connection"""
+        session = requests.Session()
+        session.verify = False
+        session.mount('https://', LCUAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+        return session
     
     def find_league_client(self) -> bool:
         """Find the League of Legends client process and extract connection info"""
@@ -48,47 +221,76 @@ class LCUConnection:
             return True
             
         self.connected = False
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-            if proc.info['name'] == 'LeagueClientUx.exe':
-                self.process = proc
-                cmdline = proc.cmdline()
-                
-                auth_token = next((x for x in cmdline if x.startswith('--remoting-auth-token=')), None)
-                port = next((x for x in cmdline if x.startswith('--app-port=')), None)
-                
-                if auth_token and port:
-                    self.auth_token = auth_token.split('=')[1]
-                    self.port = port.split('=')[1]
-                    
-                    userpass = f'riot:{self.auth_token}'
-                    encoded_credentials = base64.b64encode(userpass.encode('utf-8')).decode('utf-8')
-                    self.headers = {
-                        'Authorization': f'Basic {encoded_credentials}',
-                        'Content-Type': 'application/json',
-                        'Accept': 'application/json'
-                    }
-                    self.base_url = f'https://127.0.0.1:{self.port}'
-                    self.connected = True
-                    success_logger.info("Successfully connected to League Client")
+        
+        # Revalidate the last known client process before walking the whole process table
+        if self._pid is not None:
+            try:
+                proc = psutil.Process(self._pid)
+                if proc.name() == 'LeagueClientUx.exe' and self._connect_to_process(proc):
                     return True
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+            self._pid = None
+        
+        # Only prefetch names; cmdline is read just for the client process in _connect_to_process
+        for proc in psutil.process_iter(['name']):
+            if proc.info['name'] != 'LeagueClientUx.exe':
+                continue
+            if self._connect_to_process(proc):
+                return True
         
         return False
     
+    def _connect_to_process(self, proc: psutil.Process) -> bool:
+        """Extract the auth token and port from a client process and mark the connection live"""
+        if self._cmdline_parsed and self._cmdline_parsed[0] == proc.pid:
+            _, auth_token, port = self._cmdline_parsed
+        else:
+            cmdline = proc.cmdline()
+            
+            auth_token = next((x for x in cmdline if x.startswith('--remoting-auth-token=')), None)
+            port = next((x for x in cmdline if x.startswith('--app-port=')), None)
+            
+            if not auth_token or not port:
+                return False
+            
+            auth_token = auth_token.split('=')[1]
+            port = port.split('=')[1]
+            self._cmdline_parsed = (proc.pid, auth_token, port)
+        
+        self.process = proc
+        self._pid = proc.pid
+        
+        if auth_token != self.auth_token or port != self.port:
+            self.auth_token = auth_token
+            self.port = port
+            
+            # Drop pooled sockets that may still point at a dead client
+            self.session.close()
+            self.session = self._create_session()
+            
+            # Build the Basic credential once per token; both HTTP and websocket reuse it
+            self.auth_bytes = b'Basic ' + base64.b64encode(f'riot:{self.auth_token}'.encode('utf-8'))
+            self.headers = {**LCU_HEADERS_TEMPLATE, 'Authorization': self.auth_bytes.decode('ascii')}
+            self.ws_headers = {"Authorization": self.headers['Authorization']}
+            self.base_url = f'https://127.0.0.1:{self.port}'
+        
+        self.connected = True
+        success_logger.info("Successfully connected to League Client")
+        return True
+    
     def request(self, method: str, endpoint: str, data: Any = None) -> Optional[Dict]:
-        """Send an HTTP request to the LCU API"""
+        """Send an HTTP request to the LCU API; bytes data is sent as an already-encoded JSON body"""
         if not self.connected and not self.find_league_client():
             return None
                 
-        url = f'{self.base_url}{endpoint}'
+        url = self.base_url + endpoint
         
         try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=self.headers,
-                json=data,
-                verify=False
-            )
+            if isinstance(data, bytes):
+                response = self.session.request(method=method, url=url, headers=self.headers, data=data)
+            else:
+                response = self.session.request(method=method, url=url, headers=self.headers, json=data)
             
             if response.status_code == 404:
                 return None
@@ -103,45 +305,49 @@ class LCUConnection:
             self.connected = False
             return None
     
-    def establish_websocket(self, callback) -> bool:
-        """Connect to the LCU websocket for real-time updates"""
+    def establish_websocket(self, callback, uri: Optional[str] = None) -> bool:
+        """Connect to the LCU websocket for real-time updates, optionally only for events on `uri`"""
         if self.ws_connected and self.ws:
             return True
             
         if not self.connected and not self.find_league_client():
             return False
         
-        userpass = f'riot:{self.auth_token}'
-        encoded_credentials = base64.b64encode(userpass.encode('utf-8')).decode('utf-8')
-        
         ws_url = f"wss://127.0.0.1:{self.port}/"
-        ws_headers = {
-            "Authorization": f"Basic {encoded_credentials}"
-        }
+        
+        # The event URI appears quoted in the raw frame, so unrelated events can be
+        # dropped before paying for a full JSON decode
+        uri_text = f'"{uri}"' if uri else None
+        uri_bytes = uri_text.encode('utf-8') if uri else None
         
         def on_message(ws, message):
+            if uri_text and (uri_bytes if isinstance(message, bytes) else uri_text) not in message:
+                return
             try:
-                callback(json.loads(message))
-            except json.JSONDecodeError:
-                pass
+                event = json_loads(message)
+            except ValueError:  # json and orjson decode errors both subclass ValueError
+                return
+            callback(event)
             
         def on_error(ws, error):
             logger.error(f"WebSocket error: {error}")
             self.ws_connected = False
+            self._notify_disconnect()
             
         def on_close(ws, close_status_code, close_msg):
             logger.info("WebSocket connection closed")
             self.ws_connected = False
+            self._notify_disconnect()
             
         def on_open(ws):
             success_logger.info("WebSocket connection established")
-            ws.send(json.dumps([5, 'OnJsonApiEvent']))
+            ws.send(WS_SUBSCRIBE_MESSAGE)
             self.ws_connected = True
             
         websocket.enableTrace(False)
         self.ws = websocket.WebSocketApp(
             ws_url,
-            header=ws_headers,
+            header=self.ws_headers,
             on_open=on_open,
             on_message=on_message,
             on_error=on_error,
@@ -163,100 +369,32 @@ class RuneManager:
         self.lcu = lcu_connection
         self.current_page_id = None
         self.rune_data = {}
+        self._loaded_from = {}  # champion name -> rune_data.json key it was resolved from
+        self._fetched = {}  # champion name -> rune_data.json mtime after its last scrape
+        self._serialized_bodies: Dict[tuple, bytes] = {}  # (champion, role) -> encoded page body
+        self._auto_page_id = None  # id of the page last written by apply_runes_for_champion
         self.lock = threading.Lock()
         
-        # Define mappings
-        self.path_id_map = {
-            "Precision": 8000,
-            "Domination": 8100,
-            "Sorcery": 8200,
-            "Inspiration": 8300,
-            "Resolve": 8400
-        }
+        self.path_id_map = PATH_ID_MAP
+        self.rune_id_map = RUNE_ID_MAP
         
-        # Simplified rune map
-        self.rune_id_map = {
-            # Precision
-            "Press the Attack": 8005,
-            "Lethal Tempo": 8008,
-            "Fleet Footwork": 8021,
-            "Conqueror": 8010,
-            "Absorb Life": 9101,
-            "Triumph": 9111,
-            "Presence of Mind": 8009,
-            "Legend: Alacrity": 9104,
-            "Legend: Haste": 9105,
-            "Legend: Bloodline": 9103,
-            "Coup de Grace": 8014,
-            "Cut Down": 8017,
-            "Last Stand": 8299,
-            
-            # Domination
-            "Electrocute": 8112,
-            "Predator": 8124,
-            "Dark Harvest": 8128,
-            "Hail of Blades": 9923,
-            "Cheap Shot": 8126,
-            "Taste of Blood": 8139,
-            "Sudden Impact": 8143,
-            "Sixth Sense": 8137,
-            "Grisly Mementos": 8140,
-            "Deep Ward": 8141,
-            "Treasure Hunter": 8135,
-            "Relentless Hunter": 8105,
-            "Ultimate Hunter": 8106,
-            
-            # Sorcery
-            "Summon Aery": 8214,
-            "Arcane Comet": 8229,
-            "Phase Rush": 8230,
-            "Axiom Arcanist": 8224,
-            "Manaflow Band": 8226,
-            "Nimbus Cloak": 8275,
-            "Transcendence": 8210,
-            "Celerity": 8234,
-            "Absolute Focus": 8233,
-            "Scorch": 8237,
-            "Waterwalking": 8232,
-            "Gathering Storm": 8236,
-            
-            # Resolve
-            "Grasp of the Undying": 8437,
-            "Aftershock": 8439,
-            "Guardian": 8465,
-            "Demolish": 8446,
-            "Font of Life": 8463,
-            "Shield Bash": 8401,
-            "Conditioning": 8429,
-            "Second Wind": 8444,
-            "Bone Plating": 8473,
-            "Overgrowth": 8451,
-            "Revitalize": 8453,
-            "Unflinching": 8242,
-            
-            # Inspiration
-            "Glacial Augment": 8351,
-            "Unsealed Spellbook": 8360,
-            "First Strike": 8369,
-            "Hextech Flashtraption": 8306,
-            "Magical Footwear": 8304,
-            "Cash Back": 8321,
-            "Triple Tonic": 8313,
-            "Time Warp Tonic": 8352,
-            "Biscuit Delivery": 8345,
-            "Cosmic Insight": 8347,
-            "Approach Velocity": 8410,
-            "Jack Of All Trades": 8316,
-            
-            # Stat shards
-            "Adaptive Force": 5008,
-            "Attack Speed": 5005,
-            "Ability Haste": 5007,
-            "Move Speed": 5010,
-            "Tenacity and Slow Resist": 5013,
-            "Health": 5011,
-            "Health Scaling": 5001
-        }
+        # Resolve the in-process scraper once instead of importing on every fetch
+        self._scraper_source, self._scraper = self._resolve_scraper()
+        self._subprocess_failed = False  # set once the subprocess fallback has failed to run
+    
+    @staticmethod
+    def _resolve_scraper():
+        """Find the first importable scraper, returning (source name, callable)"""
+        for module_name, func_name, source in (
+            ("headless_scraper", "get_runes_headless", "headless scraper"),
+            ("app", "get_full_rune_tree", "app.py"),
+        ):
+            try:
+                module = importlib.import_module(module_name)
+                return source, getattr(module, func_name)
+            except (ImportError, AttributeError):
+                continue
+        return None, None
     
     def load_rune_data_from_file(self, champion_name: str) -> bool:
         """Load rune data for a specific champion from the rune_data.json file"""
@@ -264,8 +402,11 @@ class RuneManager:
             if not os.path.exists("rune_data.json"):
                 return False
                 
-            with open("rune_data.json", "r") as f:
-                scraped_data = json.load(f)
+            file_key, scraped_data = read_rune_data_file("rune_data.json")
+            
+            # Skip ID resolution if this champion was already loaded from the same file
+            if self._loaded_from.get(champion_name) == file_key and champion_name in self.rune_data:
+                return True
             
             if scraped_data.get("champion", "").lower() != champion_name.lower():
                 return False
@@ -324,6 +465,8 @@ class RuneManager:
                     "selected_perks": selected_perks
                 }
             }
+            self._loaded_from[champion_name] = file_key
+            self._serialized_bodies.pop((champion_name, "auto"), None)
             
             success_logger.info(f"Successfully loaded rune data for {champion_name}")
             return True
@@ -334,57 +477,97 @@ class RuneManager:
     def find_rune_id(self, rune_name: str) -> Optional[int]:
         """Find a rune ID by name, with fuzzy matching if needed"""
         # Direct match
-        if rune_name in self.rune_id_map:
-            return self.rune_id_map[rune_name]
+        rune_id = RUNE_ID_MAP.get(rune_name)
+        if rune_id:
+            return rune_id
+        
+        # Case-insensitive match
+        rune_name_lower = rune_name.lower()
+        rune_id = RUNE_ID_MAP_LOWER.get(rune_name_lower)
+        if rune_id:
+            return rune_id
+        
+        # Token match - resolve if the words identify exactly one rune
+        tokens = rune_name_lower.split()
+        if tokens:
+            candidates = set(TOKEN_INDEX.get(tokens[0], ()))
+            for token in tokens[1:]:
+                if not candidates:
+                    break
+                candidates.intersection_update(TOKEN_INDEX.get(token, ()))
+            if len(candidates) == 1:
+                return candidates.pop()
         
         # Fuzzy match
-        for known_name, known_id in self.rune_id_map.items():
-            if known_name.lower() in rune_name.lower() or rune_name.lower() in known_name.lower():
+        for known_name, known_id in RUNE_LOWER_ITEMS:
+            if known_name in rune_name_lower or rune_name_lower in known_name:
                 return known_id
         
         return None
     
+    @staticmethod
+    def _rune_file_mtime() -> Optional[int]:
+        """Return the rune_data.json modification time, or None if it does not exist"""
+        try:
+            return os.stat("rune_data.json").st_mtime_ns
+        except OSError:
+            return None
+    
+    def _load_fetched(self, champion_name: str) -> bool:
+        """Load freshly scraped data and remember which file version it came from"""
+        if not self.load_rune_data_from_file(champion_name):
+            return False
+        self._fetched[champion_name] = self._rune_file_mtime()
+        return True
+    
+    def clear_session_cache(self):
+        """Forget per-champ-select state so the next lock-in fetches again"""
+        self._fetched.clear()
+    
     def fetch_runes_for_champion(self, champion_name: str) -> bool:
         """Fetch runes for a champion using the headless scraper"""
         with self.lock:  # Prevent multiple simultaneous fetches for the same champion
+            # Skip the scrape if rune_data.json is unchanged since this champion was fetched
+            if champion_name in self.rune_data and self._fetched.get(champion_name) == self._rune_file_mtime():
+                return True
+            
+            if self._scraper:
+                success_logger.info(f"Fetching runes for {champion_name} using {self._scraper_source}")
+                self._scraper(champion_name.lower())
+                return self._load_fetched(champion_name)
+            
+            # Try subprocess as a last resort, unless no script has been able to run before
+            if self._subprocess_failed:
+                return False
             try:
-                # Try headless scraper first
-                try:
-                    from headless_scraper import get_runes_headless
-                    success_logger.info(f"Fetching runes for {champion_name} using headless scraper")
-                    get_runes_headless(champion_name.lower())
-                    return self.load_rune_data_from_file(champion_name)
-                except ImportError:
-                    # Fall back to app.py
-                    from app import get_full_rune_tree # type: ignore
-                    success_logger.info(f"Fetching runes for {champion_name} using app.py")
-                    get_full_rune_tree(champion_name.lower())
-                    return self.load_rune_data_from_file(champion_name)
-            except ImportError:
-                # Try subprocess as a last resort
+                import subprocess
+                # Try headless_scraper.py
                 try:
-                    import subprocess
-                    # Try headless_scraper.py
-                    try:
-                        result = subprocess.run(
-                            [sys.executable, "headless_scraper.py", champion_name.lower()],
-                            capture_output=True, text=True
-                        )
-                        if result.returncode == 0:
-                            return self.load_rune_data_from_file(champion_name)
-                    except FileNotFoundError:
-                        pass
-                    
-                    # Try app.py
                     result = subprocess.run(
-                        [sys.executable, "app.py"],
-                        input=champion_name.encode(),
+                        [sys.executable, "headless_scraper.py", champion_name.lower()],
                         capture_output=True, text=True
                     )
-                    return self.load_rune_data_from_file(champion_name)
-                except Exception as e:
-                    logger.error(f"Error running scraper: {e}")
+                    if result.returncode == 0:
+                        return self._load_fetched(champion_name)
+                except FileNotFoundError:
+                    pass
+                
+                # Try app.py
+                result = subprocess.run(
+                    [sys.executable, "app.py"],
+                    input=champion_name,
+                    capture_output=True, text=True
+                )
+                if result.returncode != 0:
+                    # Neither script runs in this environment; later lock-ins would fail the same way
+                    logger.error(f"No scraper could be run, disabling the subprocess fallback: {result.stderr.strip()}")
+                    self._subprocess_failed = True
                     return False
+                return self._load_fetched(champion_name)
+            except Exception as e:
+                logger.error(f"Error running scraper: {e}")
+                self._subprocess_failed = True
+                return False
     
     def apply_runes_for_champion(self, champion_name: str) -> bool:
         """Apply runes for a specific champion"""
@@ -408,39 +591,51 @@ class RuneManager:
         if len(selected_perks) != 9:
             return False
             
-        # Get existing rune pages
-        pages = self.lcu.request('GET', '/lol-perks/v1/pages') or []
-        
+        # Encode the page body once per champion; it is identical for PUT and POST
+        body = self._serialized_bodies.get((champion_name, role))
+        if body is None:
+            body = json.dumps({
+                "name": f"[AUTO] {champion_name} - {role}",
+                "primaryStyleId": rune_setup['primary_style'],
+                "subStyleId": rune_setup['sub_style'],
+                "selectedPerkIds": rune_setup['selected_perks'],
+                "current": True
+            }).encode('utf-8')
+            self._serialized_bodies[(champion_name, role)] = body
+            
         try:
+            if self._auto_page_id is not None:
+                # Update the known auto page directly, skipping the pages lookup
+                result = self.lcu.request('PUT', f'/lol-perks/v1/pages/{self._auto_page_id}', body)
+                if result is not None:
+                    success_logger.info(f"Successfully updated rune page for {champion_name}")
+                    return True
+                
+                # The page was deleted or the request failed, so look it up again
+                self._auto_page_id = None
+            
+            # Get existing rune pages
+            pages = self.lcu.request('GET', '/lol-perks/v1/pages') or []
+            
             if pages:
                 # Find auto page or use first available
                 auto_rune_page = next((p for p in pages if p['name'].startswith('[AUTO]')), None)
                 page_id = auto_rune_page['id'] if auto_rune_page else pages[0]['id']
                 
                 # Update the page
-                result = self.lcu.request('PUT', f'/lol-perks/v1/pages/{page_id}', {
-                    "name": f"[AUTO] {champion_name} - {role}",
-                    "primaryStyleId": rune_setup['primary_style'],
-                    "subStyleId": rune_setup['sub_style'],
-                    "selectedPerkIds": rune_setup['selected_perks'],
-                    "current": True
-                })
+                result = self.lcu.request('PUT', f'/lol-perks/v1/pages/{page_id}', body)
                 
                 if result is not None:
+                    self._auto_page_id = page_id
                     success_logger.info(f"Successfully updated rune page for {champion_name}")
                     return True
             else:
                 # Create a new page
-                result = self.lcu.request('POST', '/lol-perks/v1/pages', {
-                    "name": f"[AUTO] {champion_name} - {role}",
-                    "primaryStyleId": rune_setup['primary_style'],
-                    "subStyleId": rune_setup['sub_style'],
-                    "selectedPerkIds": rune_setup['selected_perks'],
-                    "current": True
-                })
+                result = self.lcu.request('POST', '/lol-perks/v1/pages', body)
                 
                 if result and 'id' in result:
                     self.current_page_id = result['id']
+                    self._auto_page_id = result['id']
                     success_logger.info(f"Successfully created rune page for {champion_name}")
                     return True
             
@@ -458,36 +653,64 @@ class ChampionSelectMonitor:
         self.current_champion = None
         self.current_phase = None
         self.running = False
-        self.lock = threading.Lock()
-        self.processed_action_ids = set()
+        self.processed_action_ids: OrderedDict = OrderedDict()  # bounded, insertion-ordered set
+        self._summoner = None
+        self._champ_name_by_id: Dict[int, str] = {}
+        self._last_actions_sig = None
+        self._reconnect_evt = threading.Event()
+        self._pending_data = None
+        self._debounce_timer = None
+        self._debounce_lock = threading.Lock()
+        self._process_lock = threading.Lock()
+        
+        # Rune updates run on a single worker so scraping never blocks event processing
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AutoRunesApply")
+        self._queue_slots = threading.Semaphore(2)
+    
+    def _mark_processed(self, action_id):
+        """Record a handled action, evicting the oldest once the bound is reached"""
+        self.processed_action_ids[action_id] = None
+        self.processed_action_ids.move_to_end(action_id)
+        if len(self.processed_action_ids) > MAX_PROCESSED_ACTIONS:
+            self.processed_action_ids.popitem(last=False)
     
     def on_champion_locked(self, champion_name: str, action_id: str):
-        """Handle champion lock-in event"""
+        """Handle champion lock-in event by queuing the rune update on the worker thread"""
         # Skip already processed actions
         if action_id in self.processed_action_ids:
             return
             
-        with self.lock:
-            self.processed_action_ids.add(action_id)
-            success_logger.info(f"Champion locked in: {champion_name}")
+        self._mark_processed(action_id)
+        success_logger.info(f"Champion locked in: {champion_name}")
+        
+        # Bound the backlog of queued updates; blocks here instead of queuing without limit
+        self._queue_slots.acquire()
+        try:
+            future = self._executor.submit(self._apply_runes, champion_name)
+        except RuntimeError:  # executor already shut down by stop()
+            self._queue_slots.release()
+            return
+        future.add_done_callback(lambda _: self._queue_slots.release())
+    
+    def _apply_runes(self, champion_name: str):
+        """Apply runes for a locked-in champion, refetching once on failure"""
+        try:
+            start_time = time.time()
             
-            try:
-                start_time = time.time()
-                
-                # Apply runes, with retry on failure
-                success = self.rune_manager.apply_runes_for_champion(champion_name)
-                elapsed_time = time.time() - start_time
-                
-                if success:
-                    success_logger.info(f"Applied runes for {champion_name} in {elapsed_time:.2f} seconds")
-                else:
-                    logger.info("Attempting to fetch and apply runes one more time...")
-                    if self.rune_manager.fetch_runes_for_champion(champion_name):
-                        success = self.rune_manager.apply_runes_for_champion(champion_name)
-                        if success:
-                            success_logger.info(f"Successfully applied runes on second attempt for {champion_name}")
-            except Exception as e:
-                logger.error(f"Error in champion lock-in handler: {e}")
+            # Apply runes, with retry on failure
+            success = self.rune_manager.apply_runes_for_champion(champion_name)
+            elapsed_time = time.time() - start_time
+            
+            if success:
+                success_logger.info(f"Applied runes for {champion_name} in {elapsed_time:.2f} seconds")
+            else:
+                logger.info("Attempting to fetch and apply runes one more time...")
+                if self.rune_manager.fetch_runes_for_champion(champion_name):
+                    success = self.rune_manager.apply_runes_for_champion(champion_name)
+                    if success:
+                        success_logger.info(f"Successfully applied runes on second attempt for {champion_name}")
+        except Exception as e:
+            logger.error(f"Error in champion lock-in handler: {e}")
     
     def start(self):
         """Start monitoring champion select"""
@@ -495,11 +718,28 @@ class ChampionSelectMonitor:
         
         def handle_ws_message(message):
             # Only process champion select session events
-            if len(message) < 3 or message[2].get('uri') != '/lol-champ-select/v1/session':
+            if len(message) < 3 or message[2].get('uri') != CHAMP_SELECT_SESSION_URI:
                 return
-                
-            data = message[2].get('data', {})
             
+            # Coalesce bursts of session updates; only the latest one in the window is processed
+            with self._debounce_lock:
+                self._pending_data = message[2].get('data', {})
+                if self._debounce_timer is None:
+                    self._debounce_timer = threading.Timer(WS_DEBOUNCE_SECONDS, flush_pending)
+                    self._debounce_timer.daemon = True
+                    self._debounce_timer.start()
+        
+        def flush_pending():
+            with self._debounce_lock:
+                data = self._pending_data
+                self._pending_data = None
+                self._debounce_timer = None
+            
+            # Keep session processing serialized as it was on the websocket thread
+            with self._process_lock:
+                process_session(data)
+        
+        def process_session(data):
             # Track phase changes
             phase = data.get('timer', {}).get('phase')
             if phase and phase != self.current_phase:
@@ -509,31 +749,48 @@ class ChampionSelectMonitor:
                 if phase == "None":
                     self.current_champion = None
                     self.processed_action_ids.clear()
+                    self._summoner = None
+                    self._champ_name_by_id.clear()
+                    self._last_actions_sig = None
+                    self.rune_manager.clear_session_cache()
                     return
             
             # Skip if no data or not in champion select
             if not data or not self.current_phase:
                 return
             
-            # Get local player
-            local_player = self.lcu.request('GET', '/lol-summoner/v1/current-summoner')
+            # Skip timer ticks where no action changed since the last full scan
+            actions = data.get('actions', [])
+            actions_sig = hash(tuple(
+                (a.get('id'), a.get('actorCellId'), a.get('championId'), a.get('completed'))
+                for action_group in actions for a in action_group
+            ))
+            if actions_sig == self._last_actions_sig:
+                return
+            
+            # Get local player (cached until champion select ends)
+            if not self._summoner:
+                self._summoner = self.lcu.request('GET', '/lol-summoner/v1/current-summoner')
+            local_player = self._summoner
             if not local_player:
                 return
                 
             # Find local player's actions
+            # The cell changes every game, so read it from each frame rather than caching it
             local_player_id = local_player.get('summonerId')
-            local_cell = None
-            
-            for player in data.get('myTeam', []):
-                if player.get('summonerId') == local_player_id:
-                    local_cell = player.get('cellId')
-                    break
-            
+            local_cell = data.get('localPlayerCellId')
             if local_cell is None:
-                return
+                for player in data.get('myTeam', []):
+                    if player.get('summonerId') == local_player_id:
+                        local_cell = player.get('cellId')
+                        break
+                
+                if local_cell is None:
+                    return
                 
-            # Find the player's actions
-            for action_group in data.get('actions', []):
+            # Find the player's actions; only remember the signature if every lookup succeeded
+            scan_complete = True
+            for action_group in actions:
                 for action in action_group:
                     if action.get('actorCellId') == local_cell:
                         champion_id = action.get('championId')
@@ -543,14 +800,19 @@ class ChampionSelectMonitor:
                         if not champion_id or champion_id == 0:
                             continue
                             
-                        # Get champion data
-                        champion_data = self.lcu.request('GET', f'/lol-champions/v1/inventories/{local_player_id}/champions/{champion_id}')
-                        if not champion_data:
-                            continue
-                            
-                        champion_name = champion_data.get('name')
+                        # Get champion name, fetching it only once per champion
+                        champion_name = self._champ_name_by_id.get(champion_id)
                         if not champion_name:
-                            continue
+                            champion_data = self.lcu.request('GET', f'/lol-champions/v1/inventories/{local_player_id}/champions/{champion_id}')
+                            if not champion_data:
+                                scan_complete = False
+                                continue
+                                
+                            champion_name = champion_data.get('name')
+                            if not champion_name:
+                                scan_complete = False
+                                continue
+                            self._champ_name_by_id[champion_id] = champion_name
                             
                         # Handle champion selection - clear processed actions if champion changes
                         if champion_name != self.current_champion:
@@ -561,24 +823,43 @@ class ChampionSelectMonitor:
                         # If champion locked in and action not processed yet, apply runes
                         if action.get('completed') and action_id not in self.processed_action_ids:
                             self.on_champion_locked(champion_name, action_id)
+            
+            self._last_actions_sig = actions_sig if scan_complete else None
         
         # Start WebSocket connection
-        if self.lcu.establish_websocket(handle_ws_message):
+        self.lcu.disconnect_listeners.append(self._reconnect_evt)
+        if self.lcu.establish_websocket(handle_ws_message, CHAMP_SELECT_SESSION_URI):
             logger.info("Champion select monitor started")
             
-            # Main loop to check for connection
+            # Open the pooled LCU connection and cache the summoner before champ select starts
+            if not self._summoner:
+                self._summoner = self.lcu.request('GET', '/lol-summoner/v1/current-summoner')
+            
+            # Main loop to check for connection, woken early when the websocket drops
             while self.running:
+                connected = self.lcu.connected and self.lcu.ws_connected
+                self._reconnect_evt.wait(timeout=30 if connected else 5)
+                self._reconnect_evt.clear()
+                if not self.running:
+                    break
+                
                 if not self.lcu.connected or not self.lcu.ws_connected:
                     if self.lcu.find_league_client():
-                        self.lcu.establish_websocket(handle_ws_message)
-                
-                time.sleep(5)
+                        self.lcu.establish_websocket(handle_ws_message, CHAMP_SELECT_SESSION_URI)
         else:
             logger.error("Failed to establish websocket connection")
     
     def stop(self):
         """Stop monitoring champion select"""
         self.running = False
+        if self._reconnect_evt in self.lcu.disconnect_listeners:
+            self.lcu.disconnect_listeners.remove(self._reconnect_evt)
+        self._reconnect_evt.set()
+        with self._debounce_lock:
+            if self._debounce_timer:
+                self._debounce_timer.cancel()
+                self._debounce_timer = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
         logger.info("Champion select monitor stopped")
 
 class AutoRunesService:
@@ -589,6 +870,8 @@ class AutoRunesService:
         self.rune_manager = RuneManager(self.lcu)
         self.monitor = None
         self.running = False
+        self._reconnect_evt = threading.Event()
+        self.lcu.disconnect_listeners.append(self._reconnect_evt)
     
     def start(self):
         """Start the auto runes service"""
@@ -618,12 +901,15 @@ class AutoRunesService:
                         self.monitor.stop()
                         self.monitor = None
                         logger.info("League client closed, monitoring stopped")
-                
-            time.sleep(10)
+            
+            # Poll for the client while disconnected; otherwise sleep until the websocket drops
+            self._reconnect_evt.wait(timeout=30 if self.lcu.connected else 10)
+            self._reconnect_evt.clear()
     
     def stop(self):
         """Stop the auto runes service"""
         self.running = False
+        self._reconnect_evt.set()
         if self.monitor:
             self.monitor.stop()
         logger.info("Auto Runes service stopped")
@@ -1,19 +1,197 @@
 #!/usr/bin/env python
 import sys
 import os
+import re
 import json
+import getpass
 import time
+import logging
+import socket
+import atexit
+import threading
+import queue
+import asyncio
+import requests
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
+from html.parser import HTMLParser
+from multiprocessing.connection import AuthenticationError, Client
+from urllib.parse import urlsplit
+from playwright.async_api import async_playwright
 from playwright.sync_api import sync_playwright
 
-def get_runes_headless(champion_name):
+logger = logging.getLogger("RuneScraper")
+
+# Prefer orjson for the machine-read cache when it is installed
+try:
+    from orjson import loads as json_loads, dumps as json_dumps_bytes
+except ImportError:
+    json_loads = json.loads
+    
+    def json_dumps_bytes(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+UGG_BUILD_URL = "https://u.gg/lol/champions/{champion}/build"
+# Local warm-browser daemon (see headless_scraper_daemon.py). It listens on a named pipe on
+# Windows and on a socket in a user-private directory elsewhere, and authenticates clients
+# with a random key it writes next to the socket when it starts.
+if sys.platform == "win32":
+    DAEMON_DIR = os.path.join(os.environ.get("LOCALAPPDATA") or os.path.expanduser("~"), "lol-runes-scraper")
+    DAEMON_ADDRESS = r"\\.\pipe\lol-runes-scraper-" + getpass.getuser()
+else:
+    DAEMON_DIR = os.path.join(os.environ.get("XDG_RUNTIME_DIR") or os.path.expanduser("~/.cache"), "lol-runes-scraper")
+    DAEMON_ADDRESS = os.path.join(DAEMON_DIR, "daemon.sock")
+DAEMON_KEY_FILE = os.path.join(DAEMON_DIR, "daemon.key")
+DAEMON_MAX_MESSAGE = 64 * 1024
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# All champions share one cache file; entries expire CACHE_TTL seconds after fetched_at
+CACHE_FILE = "cache.json"
+CACHE_TTL = 86400  # 24 hours
+
+# Recently used cache entries, so long-lived processes skip the cache file on repeat lookups
+_MEM_CACHE = OrderedDict()
+_MEM_CACHE_SIZE = 256
+_MEM_CACHE_LOCK = threading.Lock()
+
+# champion -> (fetched_at, rune_data.json text), so repeat hits on the same cache entry skip re-serializing
+_RUNE_JSON_TEXT = {}
+
+# Chromium flags shared by the pooled and batch browsers
+BROWSER_ARGS = [
+    '--disable-extensions',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-features=TranslateUI,BlinkGenPropertyTrees',
+    '--disable-ipc-flooding-protection',
+    '--disable-renderer-backgrounding',
+    '--mute-audio',
+    # Images and web fonts are never requested, so they do not reach the route handler
+    '--blink-settings=imagesEnabled=false',
+    '--disable-remote-fonts'
+]
+
+# Requests the browser never needs for reading the rune tree (images and fonts are off via BROWSER_ARGS)
+BLOCK_RESOURCE_TYPES = frozenset({"stylesheet", "media"})
+BLOCK_HOSTS = frozenset({
+    "doubleclick.net", "googlesyndication.com", "google-analytics.com",
+    "googletagmanager.com", "googletagservices.com", "amazon-adsystem.com",
+    "adnxs.com", "pubmatic.com", "rubiconproject.com", "criteo.com",
+    "scorecardresearch.com", "quantserve.com", "facebook.net", "cloudflareinsights.com"
+})
+
+def _should_block(request):
+    """True for heavy resources and requests to ad/analytics hosts or their subdomains"""
+    if request.resource_type in BLOCK_RESOURCE_TYPES:
+        return True
+    parts = (urlsplit(request.url).hostname or "").split(".")
+    return any(".".join(parts[i:]) in BLOCK_HOSTS for i in range(len(parts) - 1))
+
+def _route_filter(route):
+    if _should_block(route.request):
+        route.abort()
+    else:
+        route.continue_()
+
+async def _route_filter_async(route):
+    if _should_block(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
+
+# Shared HTTP session so back-to-back champion fetches reuse the u.gg connection
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": USER_AGENT})
+atexit.register(_SESSION.close)
+
+def _warmup():
+    """Resolve u.gg and open a pooled TLS connection before the first champion is requested"""
+    try:
+        host = urlsplit(UGG_BUILD_URL).hostname
+        socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+        _SESSION.head(f"https://{host}/", timeout=5)
+    except Exception as e:
+        logger.debug(f"Connection warmup failed: {e}")
+
+threading.Thread(target=_warmup, name="RuneScraperWarmup", daemon=True).start()
+
+# Elements that never have a closing tag, so they are not pushed on the parse stack
+VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr"
+})
+
+class _Node:
+    """Minimal DOM element built from the server-rendered page"""
+    __slots__ = ("tag", "attrs", "classes", "children")
+    
+    def __init__(self, tag, attrs):
+        self.tag = tag
+        self.attrs = dict(attrs)
+        self.classes = frozenset((self.attrs.get("class") or "").split())
+        self.children = []  # mix of _Node and text strings, in document order
+    
+    def iter(self):
+        """Yield every descendant element depth-first"""
+        for child in self.children:
+            if isinstance(child, _Node):
+                yield child
+                yield from child.iter()
+    
+    def find_all(self, *classes, tag=None):
+        wanted = frozenset(classes)
+        return [n for n in self.iter() if wanted <= n.classes and (tag is None or n.tag == tag)]
+    
+    def find(self, *classes, tag=None):
+        wanted = frozenset(classes)
+        return next((n for n in self.iter() if wanted <= n.classes and (tag is None or n.tag == tag)), None)
+    
+    def text_content(self):
+        return "".join(c if isinstance(c, str) else c.text_content() for c in self.children)
+
+class _TreeBuilder(HTMLParser):
+    """Builds a _Node tree, tolerating the unclosed tags real pages contain"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = _Node("#document", ())
+        self._stack = [self.root]
+    
+    def handle_starttag(self, tag, attrs):
+        node = _Node(tag, attrs)
+        self._stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self._stack.append(node)
+    
+    def handle_startendtag(self, tag, attrs):
+        self._stack[-1].children.append(_Node(tag, attrs))
+    
+    def handle_endtag(self, tag):
+        for i in range(len(self._stack) - 1, 0, -1):
+            if self._stack[i].tag == tag:
+                del self._stack[i:]
+                break
+    
+    def handle_data(self, data):
+        self._stack[-1].children.append(data)
+
+def _img_alt(node):
+    """Return the alt text of the first image under node, or None"""
+    img = node.find(tag="img") if node else None
+    return img.attrs.get("alt") if img else None
+
+def parse_rune_page(html):
     """
-    Optimized wrapper function that runs the scraper in headless mode with speed improvements
+    Extract rune fields from u.gg build page HTML using the same selectors as the browser path.
+    Missing fields are left empty.
     """
-    print(f"Fetching runes for {champion_name} in headless mode...")
-    start_time = time.time()
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    root = builder.root
     
     rune_data = {
-        "champion": champion_name,
         "primary_path": "",
         "keystone": "",
         "primary_runes": [],
@@ -22,174 +200,601 @@ def get_runes_headless(champion_name):
         "stat_shards": []
     }
     
-    # Check cache first (for champions scraped in the last 24 hours)
-    cache_file = f"cache_{champion_name}.json"
-    if os.path.exists(cache_file) and (time.time() - os.path.getmtime(cache_file) < 86400):  # 24 hours
+    # Locate the first of each region in one walk instead of re-scanning the document per field
+    primary_tree = keystone_row = secondary_tree = stat_container = None
+    for node in root.iter():
+        classes = node.classes
+        if primary_tree is None and "primary-tree" in classes and "rune-tree" in classes:
+            primary_tree = node
+        if keystone_row is None and "keystone-row" in classes and "perk-row" in classes:
+            keystone_row = node
+        if secondary_tree is None and "secondary-tree" in classes:
+            secondary_tree = node
+        if stat_container is None and "stat-shards-container" in classes and "rune-tree" in classes:
+            stat_container = node
+        if primary_tree and keystone_row and secondary_tree and stat_container:
+            break
+    
+    if primary_tree:
+        header = primary_tree.find("rune-tree_header")
+        if header:
+            rune_data["primary_path"] = header.text_content().strip()
+        for row in primary_tree.find_all("perk-row"):
+            if "keystone-row" in row.classes:
+                continue
+            perk_name = _img_alt(row.find("perk", "perk-active"))
+            if perk_name:
+                rune_data["primary_runes"].append(perk_name)
+    
+    keystone_name = _img_alt(keystone_row.find("perk", "perk-active")) if keystone_row else None
+    if keystone_name:
+        rune_data["keystone"] = keystone_name
+    
+    if secondary_tree:
+        header = secondary_tree.find("rune-tree_header")
+        if header:
+            rune_data["secondary_path"] = header.text_content().strip()
+        for perk in secondary_tree.find_all("perk", "perk-active"):
+            perk_name = _img_alt(perk)
+            if perk_name:
+                rune_data["secondary_runes"].append(perk_name)
+    
+    if stat_container:
+        for shard in stat_container.find_all("shard", "shard-active"):
+            shard_name = _img_alt(shard)
+            if shard_name:
+                rune_data["stat_shards"].append(shard_name)
+    
+    return _clean_extracted(rune_data)
+
+# Next.js pages embed their pre-rendered state as JSON; '<' inside it is escaped, so [^<] spans the blob
+_NEXT_DATA = re.compile(r'<script id="__NEXT_DATA__"[^>]*>([^<]+)</script>')
+_RUNE_FIELDS = ("primary_path", "keystone", "primary_runes", "secondary_path", "secondary_runes", "stat_shards")
+
+def parse_next_data(html):
+    """
+    Extract rune fields from the page's embedded __NEXT_DATA__ state, without building a DOM.
+    Returns None if there is no blob or no object in it carries every rune field by name
+    (camelCase or snake_case), so callers can fall back to parse_rune_page.
+    """
+    match = _NEXT_DATA.search(html)
+    if not match:
+        return None
+    try:
+        stack = [json_loads(match.group(1))]
+    except ValueError:
+        return None
+    
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+            continue
+        if not isinstance(node, dict):
+            continue
+        
+        fields = {key.replace("_", "").lower(): value for key, value in node.items() if isinstance(key, str)}
+        raw = {field: fields.get(field.replace("_", "")) for field in _RUNE_FIELDS}
+        if (all(isinstance(raw[field], str) and raw[field] for field in ("primary_path", "keystone", "secondary_path"))
+                and all(isinstance(raw[field], list) and raw[field]
+                        and all(isinstance(name, str) for name in raw[field])
+                        for field in ("primary_runes", "secondary_runes", "stat_shards"))):
+            return _clean_extracted(raw)
+        stack.extend(node.values())
+    return None
+
+# u.gg alt texts read "The Keystone X", "The Rune X" or "The X Shard"
+_CLEAN_NAME = re.compile(r'^The (?:Keystone |Rune )?|\s+Shard$')
+
+# Dismisses the cookie consent popup in-page if it shows up, without blocking navigation
+CONSENT_SCRIPT = """
+document.addEventListener('DOMContentLoaded', () => {
+    const button = [...document.querySelectorAll('button')].find(b => b.textContent.includes('Consent'));
+    if (button) button.click();
+});
+"""
+
+# Builds the same fields as parse_rune_page from the live DOM, in one evaluate call
+JS_EXTRACT = """
+() => {
+    // Select the active images directly rather than stepping through rows and perks
+    const alts = (root, selector) => root
+        ? Array.from(root.querySelectorAll(selector), img => img.getAttribute('alt')).filter(Boolean)
+        : [];
+    const keystoneImg = document.querySelector('.perk-row.keystone-row .perk.perk-active img');
+    const header = tree => {
+        const el = tree && tree.querySelector('.rune-tree_header');
+        return el ? el.textContent.trim() : '';
+    };
+    const primary = document.querySelector('.rune-tree.primary-tree');
+    const secondary = document.querySelector('.secondary-tree');
+    return {
+        primary_path: header(primary),
+        keystone: (keystoneImg && keystoneImg.getAttribute('alt')) || '',
+        primary_runes: alts(primary, '.perk-row:not(.keystone-row) .perk.perk-active img'),
+        secondary_path: header(secondary),
+        secondary_runes: alts(secondary, '.perk.perk-active img'),
+        stat_shards: alts(document.querySelector('.rune-tree.stat-shards-container'), '.shard.shard-active img')
+    };
+}
+"""
+
+def _clean(name):
+    return _CLEAN_NAME.sub("", name)
+
+def _clean_extracted(raw):
+    """Strip u.gg's descriptive prefixes/suffixes from extracted image alt texts"""
+    return {
+        "primary_path": raw.get("primary_path", ""),
+        "keystone": _clean(raw.get("keystone") or ""),
+        "primary_runes": [_clean(name) for name in raw.get("primary_runes", [])],
+        "secondary_path": raw.get("secondary_path", ""),
+        "secondary_runes": [_clean(name) for name in raw.get("secondary_runes", [])],
+        "stat_shards": [_clean(name) for name in raw.get("stat_shards", [])]
+    }
+
+def _log_rune_data(rune_data):
+    """Log every extracted field at DEBUG level"""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug(f"PRIMARY PATH: {rune_data['primary_path']}")
+    logger.debug(f"KEYSTONE: {rune_data['keystone']}")
+    for perk_name in rune_data["primary_runes"]:
+        logger.debug(f"• {perk_name}")
+    logger.debug(f"SECONDARY PATH: {rune_data['secondary_path']}")
+    for perk_name in rune_data["secondary_runes"]:
+        logger.debug(f"• {perk_name}")
+    for shard_name in rune_data["stat_shards"]:
+        logger.debug(f"• {shard_name}")
+
+def get_runes_http(champion_name):
+    """
+    Fetch runes from u.gg's server-rendered build page without starting a browser, preferring
+    its embedded __NEXT_DATA__ state over the HTML.
+    Returns the parsed fields, or None if the page did not contain a complete rune tree.
+    """
+    try:
+        response = _SESSION.get(UGG_BUILD_URL.format(champion=champion_name), timeout=10)
+        if response.status_code != 200:
+            logger.info(f"HTTP fetch failed with status {response.status_code}")
+            return None
+        
+        # The embedded page state is far cheaper to read than walking the HTML tree
+        html = response.text
+        rune_data = parse_next_data(html) or parse_rune_page(html)
+    except Exception as e:
+        logger.info(f"HTTP fetch error: {e}")
+        return None
+    
+    return rune_data if _is_complete(rune_data) else None
+
+def _is_complete(rune_data):
+    """True when every rune field was found"""
+    return bool(rune_data["primary_path"] and rune_data["keystone"] and rune_data["primary_runes"]
+                and rune_data["secondary_path"] and rune_data["secondary_runes"] and rune_data["stat_shards"])
+
+class RuneScraper:
+    """
+    Keeps one headless Chromium running and opens a fresh context for every scrape,
+    so only the first champion pays the browser launch
+    """
+    
+    def __init__(self):
+        self._thread = None  # owns Playwright for its whole life; the sync API is bound to one thread
+        self._jobs = None
+        self._lock = threading.Lock()
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def start(self):
+        """Start the browser thread if it is not already running"""
+        with self._lock:
+            self._ensure_thread()
+    
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._jobs = queue.Queue()
+            self._thread = threading.Thread(target=self._run, args=(self._jobs,),
+                                            name="RuneScraperBrowser", daemon=True)
+            self._thread.start()
+    
+    def close(self, timeout=10):
+        """Shut down the shared browser and Playwright driver"""
+        with self._lock:
+            thread, jobs = self._thread, self._jobs
+            self._thread = self._jobs = None
+            if thread is not None and thread.is_alive():
+                jobs.put(None)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+    
+    def fetch(self, champion_name, rune_data):
+        """Scrape champion_name's build page into rune_data, on the browser thread"""
+        done = Future()
+        with self._lock:
+            self._ensure_thread()
+            self._jobs.put((champion_name, rune_data, done))
+        done.result()
+    
+    def _run(self, jobs):
+        """Browser thread: launch Chromium once, then scrape queued champions until closed"""
+        playwright = browser = None
         try:
-            with open(cache_file, "r") as f:
-                cached_data = json.load(f)
-                print(f"Using cached data for {champion_name} (from {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(os.path.getmtime(cache_file)))})")
+            while True:
+                if browser is None or not browser.is_connected():
+                    if playwright is not None:
+                        # The browser crashed or was killed; start over with a fresh driver
+                        self._stop_driver(playwright)
+                        playwright = browser = None
+                    try:
+                        playwright = sync_playwright().start()
+                        browser = self._launch(playwright)
+                    except Exception as e:
+                        logger.error(f"Error launching browser: {e}")
+                        # Stop a driver that started but could not launch Chromium, so retries don't leak it
+                        if playwright is not None:
+                            self._stop_driver(playwright)
+                        playwright = browser = None
                 
-                # Save to the standard output file as well
-                with open("rune_data.json", "w") as out_f:
-                    json.dump(cached_data, out_f, indent=4)
-                    
-                return cached_data
+                job = jobs.get()
+                if job is None:
+                    break
+                champion_name, rune_data, done = job
+                if browser is None:
+                    done.set_exception(RuntimeError("Browser is not running"))
+                    continue
+                try:
+                    self._scrape(browser, champion_name, rune_data)
+                    done.set_result(None)
+                except Exception as e:
+                    done.set_exception(e)
+        finally:
+            try:
+                if browser:
+                    browser.close()
+                if playwright:
+                    playwright.stop()
+            except Exception as e:
+                logger.warning(f"Error closing browser: {e}")
+    
+    @staticmethod
+    def _stop_driver(playwright):
+        try:
+            playwright.stop()
         except Exception as e:
-            print(f"Cache read error: {e}, fetching fresh data")
+            logger.warning(f"Error stopping Playwright: {e}")
     
-    with sync_playwright() as p:
+    @staticmethod
+    def _launch(playwright):
         # Launch browser with optimized settings for speed
-        browser = p.chromium.launch(
-            headless=True,
-            args=[
-                '--disable-extensions',
-                '--disable-component-extensions-with-background-pages',
-                '--disable-features=TranslateUI,BlinkGenPropertyTrees',
-                '--disable-ipc-flooding-protection',
-                '--disable-renderer-backgrounding',
-                '--mute-audio'
-            ]
-        )
-        
+        return playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+    
+    @staticmethod
+    def _scrape(browser, champion_name, rune_data):
         # Create context with optimized settings
         context = browser.new_context(
             viewport={"width": 1280, "height": 800},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+            user_agent=USER_AGENT,
             java_script_enabled=True,
             ignore_https_errors=True
         )
         
+        # Enable faster navigation by ignoring non-essential resources and trackers
+        context.route("**/*", _route_filter)
+        context.add_init_script(CONSENT_SCRIPT)
+        
         page = context.new_page()
         
         # Set shorter timeouts
         page.set_default_timeout(10000)  # 10 seconds max for all operations
         
-        # Enable faster navigation by ignoring non-essential resources
-        page.route("**/*.{png,jpg,jpeg,gif,css,woff,woff2,svg}", lambda route: route.abort())
-        
         # Open u.gg and search for the champion's runes page
         try:
-            response = page.goto(f"https://u.gg/lol/champions/{champion_name}/build", wait_until="domcontentloaded")
+            # Return as soon as navigation commits; the selector wait below gates on the data we need
+            response = page.goto(UGG_BUILD_URL.format(champion=champion_name), wait_until="commit")
             
             if response.status != 200:
                 raise Exception(f"Failed to load page: {response.status}")
                 
-            # Handle cookie consent popup - reduced timeout
-            try:
-                consent_button = page.wait_for_selector("button:has-text('Consent')", timeout=2000)
-                if consent_button:
-                    consent_button.click()
-            except:
-                print("No cookie popup found or already accepted.")
-
             # Optimized selector wait - wait for the specific content we need
             # This is a more targeted approach than waiting for the entire container
             page.wait_for_selector(".rune-tree.primary-tree .rune-tree_header", timeout=8000)
             
-            # Get primary path name
-            try:
-                primary_tree = page.locator(".rune-tree.primary-tree").first
-                primary_header = primary_tree.locator(".rune-tree_header").first
-                primary_path = primary_header.text_content().strip()
-                rune_data["primary_path"] = primary_path
-                print(f"PRIMARY PATH: {primary_path}")
-            except Exception as e:
-                print(f"PRIMARY PATH: Unable to determine - {str(e)}")
-            
-            # Get keystone
-            try:
-                keystone_row = page.locator(".perk-row.keystone-row").first
-                active_keystone = keystone_row.locator(".perk.perk-active").first
-                keystone_img = active_keystone.locator("img").first
-                keystone_name = keystone_img.get_attribute("alt")
-                # Clean up keystone name by removing "The Keystone" prefix if present
-                keystone_name = keystone_name.replace("The Keystone ", "")
-                rune_data["keystone"] = keystone_name
-                print(f"KEYSTONE: {keystone_name}")
-            except Exception as e:
-                print(f"KEYSTONE: Unable to determine - {str(e)}")
-            
-            # Get primary runes from regular perk rows
-            try:
-                # Get regular perk rows (not keystone row)
-                primary_perk_rows = primary_tree.locator(".perk-row:not(.keystone-row)").all()
-                for row in primary_perk_rows:
-                    active_perk = row.locator(".perk.perk-active").first
-                    perk_img = active_perk.locator("img").first
-                    perk_name = perk_img.get_attribute("alt")
-                    # Clean up rune name by removing "The Rune" prefix if present
-                    perk_name = perk_name.replace("The Rune ", "")
-                    rune_data["primary_runes"].append(perk_name)
-                    print(f"• {perk_name}")
-            except Exception as e:
-                print(f"PRIMARY RUNES: Unable to determine - {str(e)}")
-                
-            # Get secondary path and runes
-            try:
-                secondary_tree = page.locator(".secondary-tree").first
-                secondary_header = secondary_tree.locator(".rune-tree_header").first
-                secondary_path = secondary_header.text_content().strip()
-                rune_data["secondary_path"] = secondary_path
-                print(f"\nSECONDARY PATH: {secondary_path}")
-                
-                # Get secondary runes (active ones)
-                secondary_active_perks = secondary_tree.locator(".perk.perk-active").all()
-                for perk in secondary_active_perks:
-                    perk_img = perk.locator("img").first
-                    perk_name = perk_img.get_attribute("alt")
-                    # Clean up rune name by removing "The Rune" prefix if present
-                    perk_name = perk_name.replace("The Rune ", "")
-                    rune_data["secondary_runes"].append(perk_name)
-                    print(f"• {perk_name}")
-            except Exception as e:
-                print(f"SECONDARY PATH: Unable to determine - {str(e)}")
-                
-            # Get stat shards 
-            try:
-                # Find the stat shards container
-                stat_container = page.locator(".rune-tree.stat-shards-container").first
-                
-                # Get all active shards directly
-                active_shards = stat_container.locator(".shard.shard-active").all()
-                
-                # Extract shard names from the alt attribute of img elements
-                for shard in active_shards:
-                    shard_img = shard.locator("img").first
-                    shard_name = shard_img.get_attribute("alt")
-                    # Clean up shard name by removing "The" and "Shard" if present
-                    shard_name = shard_name.replace("The ", "").replace(" Shard", "")
-                    rune_data["stat_shards"].append(shard_name)
-                    print(f"• {shard_name}")
-            except Exception as e:
-                print(f"STAT SHARDS: Unable to determine - {str(e)}")
+            # Read every field in a single in-page call instead of one round-trip per element
+            rune_data.update(_clean_extracted(page.evaluate(JS_EXTRACT)))
+            _log_rune_data(rune_data)
                 
         except Exception as e:
-            print(f"Error during scraping: {e}")
+            logger.error(f"Error during scraping: {e}")
         finally:
             context.close()
-            browser.close()
+
+scraper = RuneScraper()
+atexit.register(scraper.close)
+
+def get_runes_headless(champion_name):
+    """
+    Optimized wrapper function that runs the scraper in headless mode with speed improvements
+    """
+    logger.debug(f"Fetching runes for {champion_name} in headless mode...")
+    start_time = time.time()
+    
+    rune_data = {
+        "champion": champion_name,
+        "primary_path": "",
+        "keystone": "",
+        "primary_runes": [],
+        "secondary_path": "",
+        "secondary_runes": [],
+        "stat_shards": []
+    }
+    
+    # Check cache first (for champions scraped in the last 24 hours)
+    entry = _cache_get(champion_name)
+    if entry:
+        logger.info(f"Using cached data for {champion_name} (from {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['fetched_at']))})")
+        
+        # Save to the standard output file as well, reusing the already serialized text
+        _write_rune_json(_rune_json_text(champion_name, entry))
+            
+        return entry["data"]
+    
+    # Try the plain HTTP page first; only start a browser if it lacks the rune tree
+    http_data = get_runes_http(champion_name)
+    if http_data:
+        rune_data.update(http_data)
+        _log_rune_data(rune_data)
+    else:
+        logger.debug("Static page did not contain the rune tree, falling back to the browser")
+        scraper.fetch(champion_name, rune_data)
     
     # Validate that we got some useful data before saving
     if rune_data["primary_path"] and rune_data["keystone"] and len(rune_data["primary_runes"]) > 0:
         # Save the rune data to both cache and output file
-        with open(cache_file, "w") as f:
-            json.dump(rune_data, f, indent=4)
-            
-        with open("rune_data.json", "w") as f:
-            json.dump(rune_data, f, indent=4)
+        if not _save_cache(champion_name, rune_data):
+            logger.debug(f"Runes for {champion_name} unchanged since the last fetch")
+        
+        # Left untouched when it already holds these runes
+        _write_rune_json(json.dumps(rune_data, indent=4))
             
         elapsed_time = time.time() - start_time
-        print(f"Rune data saved to rune_data.json (completed in {elapsed_time:.2f} seconds)")
+        logger.info(f"Rune data saved to rune_data.json (completed in {elapsed_time:.2f} seconds)")
     else:
-        print("Failed to get complete rune data")
+        logger.warning("Failed to get complete rune data")
     
     return rune_data
 
+@lru_cache(maxsize=1)
+def _load_cache_file(mtime_ns, size):
+    """Parse the shared cache file; keyed on its mtime and size so only changed files are re-read"""
+    try:
+        with open(CACHE_FILE, "rb") as f:
+            return json_loads(f.read())
+    except (OSError, ValueError) as e:
+        logger.warning(f"Cache read error: {e}, ignoring cache")
+        return {}
+
+def _read_cache():
+    try:
+        st = os.stat(CACHE_FILE)
+    except OSError:
+        return {}
+    return _load_cache_file(st.st_mtime_ns, st.st_size)
+
+def _remember(champion_name, entry):
+    with _MEM_CACHE_LOCK:
+        _MEM_CACHE[champion_name] = entry
+        _MEM_CACHE.move_to_end(champion_name)
+        if len(_MEM_CACHE) > _MEM_CACHE_SIZE:
+            _MEM_CACHE.popitem(last=False)
+
+def _cache_get(champion_name):
+    """Return the cache entry for a champion if it was fetched within CACHE_TTL, else None"""
+    now = time.time()
+    with _MEM_CACHE_LOCK:
+        entry = _MEM_CACHE.get(champion_name)
+        if entry and now - entry["fetched_at"] < CACHE_TTL:
+            _MEM_CACHE.move_to_end(champion_name)
+            return entry
+    
+    entry = _read_cache().get(champion_name)
+    if entry and now - entry.get("fetched_at", 0) < CACHE_TTL:
+        _remember(champion_name, entry)
+        return entry
+    return None
+
+def read_daemon_key():
+    """The running daemon's authkey, or None if no daemon has published one"""
+    try:
+        with open(DAEMON_KEY_FILE, "rb") as f:
+            return f.read() or None
+    except OSError:
+        return None
+
+def fetch_from_daemon(champion_name):
+    """
+    Ask a running scraper daemon for a champion's runes and mirror them to rune_data.json.
+    Returns None if no daemon is listening or it could not produce data.
+    """
+    # Without a published key there is no daemon, so don't pay for a failed connect
+    authkey = read_daemon_key()
+    if authkey is None:
+        return None
+    
+    try:
+        conn = Client(DAEMON_ADDRESS, authkey=authkey)
+    except (OSError, EOFError, AuthenticationError):
+        return None
+    
+    try:
+        with conn:
+            conn.send_bytes(json_dumps_bytes({"champion": champion_name}))
+            reply = json_loads(conn.recv_bytes(DAEMON_MAX_MESSAGE))
+    except (OSError, EOFError, ValueError) as e:
+        logger.warning(f"Scraper daemon error: {e}")
+        return None
+    
+    if not isinstance(reply, dict) or not isinstance(reply.get("data"), dict):
+        error = reply.get("error") if isinstance(reply, dict) else None
+        logger.warning(f"Scraper daemon failed: {error or 'no data'}")
+        return None
+    
+    rune_data = reply["data"]
+    _log_rune_data(rune_data)
+    _write_rune_json(json.dumps(rune_data, indent=4))
+    logger.info("Rune data saved to rune_data.json (served by daemon)")
+    return rune_data
+
+def _save_cache(champion_name, rune_data):
+    """
+    Add or replace a champion's entry, rewriting the cache file atomically.
+    Returns False if the data matched the cached copy and only its fetched_at was refreshed.
+    """
+    cache = dict(_read_cache())
+    previous = cache.get(champion_name)
+    now = time.time()
+    changed = not previous or previous.get("data") != rune_data
+    
+    if changed:
+        cache[champion_name] = {"fetched_at": now, "data": rune_data}
+    else:
+        # Same runes as before: renew the TTL and carry the serialized text over to the new entry
+        cache[champion_name] = {**previous, "fetched_at": now}
+        cached_text = _RUNE_JSON_TEXT.get(champion_name)
+        if cached_text and cached_text[0] == previous.get("fetched_at"):
+            _RUNE_JSON_TEXT[champion_name] = (now, cached_text[1])
+    
+    # The cache is machine-read only, so it is written compactly
+    tmp_file = CACHE_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(json_dumps_bytes(cache))
+    os.replace(tmp_file, CACHE_FILE)
+    _remember(champion_name, cache[champion_name])
+    return changed
+
+def _rune_json_text(champion_name, entry):
+    """
+    Pretty-printed rune_data.json contents for a cache entry. The text is reused only while
+    the entry's fetched_at matches, so data written by another process is never shadowed.
+    """
+    cached = _RUNE_JSON_TEXT.get(champion_name)
+    if cached and cached[0] == entry["fetched_at"]:
+        return cached[1]
+    text = json.dumps(entry["data"], indent=4)
+    _RUNE_JSON_TEXT[champion_name] = (entry["fetched_at"], text)
+    return text
+
+def _write_rune_json(text, path="rune_data.json"):
+    """Write rune_data.json, leaving the file untouched when it already holds exactly this text"""
+    new = text.encode("utf-8")
+    try:
+        # A size mismatch settles it without reading the file
+        if os.stat(path).st_size == len(new):
+            with open(path, "rb") as f:
+                if f.read() == new:
+                    return False
+    except OSError:
+        pass
+    
+    with open(path, "wb") as f:
+        f.write(new)
+    return True
+
+async def get_runes_batch(champions, max_concurrency=5):
+    """
+    Scrape several champions concurrently, sharing one browser between them.
+    Results are returned in input order; complete ones are also written to the cache.
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+    browser_lock = asyncio.Lock()
+    browser = None
+    
+    async with async_playwright() as p:
+        async def get_browser():
+            # Only launch Chromium once some champion actually needs it
+            nonlocal browser
+            async with browser_lock:
+                if browser is None:
+                    browser = await p.chromium.launch(headless=True, args=BROWSER_ARGS)
+                return browser
+        
+        async def scrape(champion_name):
+            champion_name = champion_name.lower()
+            rune_data = {
+                "champion": champion_name,
+                "primary_path": "",
+                "keystone": "",
+                "primary_runes": [],
+                "secondary_path": "",
+                "secondary_runes": [],
+                "stat_shards": []
+            }
+            
+            async with sem:
+                http_data = await asyncio.to_thread(get_runes_http, champion_name)
+                if http_data:
+                    rune_data.update(http_data)
+                else:
+                    context = await (await get_browser()).new_context(
+                        viewport={"width": 1280, "height": 800},
+                        user_agent=USER_AGENT,
+                        ignore_https_errors=True
+                    )
+                    try:
+                        await context.route("**/*", _route_filter_async)
+                        await context.add_init_script(CONSENT_SCRIPT)
+                        page = await context.new_page()
+                        page.set_default_timeout(10000)
+                        response = await page.goto(UGG_BUILD_URL.format(champion=champion_name), wait_until="commit")
+                        if response.status != 200:
+                            raise Exception(f"Failed to load page: {response.status}")
+                        
+                        await page.wait_for_selector(".rune-tree.primary-tree .rune-tree_header", timeout=8000)
+                        
+                        rune_data.update(_clean_extracted(await page.evaluate(JS_EXTRACT)))
+                    except Exception as e:
+                        logger.error(f"Error during scraping {champion_name}: {e}")
+                    finally:
+                        await context.close()
+            
+            if rune_data["primary_path"] and rune_data["keystone"] and len(rune_data["primary_runes"]) > 0:
+                _save_cache(champion_name, rune_data)
+            else:
+                logger.warning(f"Failed to get complete rune data for {champion_name}")
+            return rune_data
+        
+        try:
+            return await asyncio.gather(*(scrape(champion) for champion in champions))
+        finally:
+            if browser is not None:
+                await browser.close()
+
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if len(sys.argv) > 1 and sys.argv[1] == "--daemon":
+        # Let the daemon import this running module instead of loading a second copy, which
+        # would bring its own browser, HTTP session, atexit hooks and warmup request
+        sys.modules.setdefault("headless_scraper", sys.modules[__name__])
+        from headless_scraper_daemon import IDLE_TIMEOUT, serve
+        serve(int(sys.argv[2]) if len(sys.argv) > 2 else IDLE_TIMEOUT)
+        sys.exit(0)
+    
+    if len(sys.argv) > 2:
+        # Several champions: scrape them concurrently into the cache
+        asyncio.run(get_runes_batch(sys.argv[1:]))
+        sys.exit(0)
+    
     if len(sys.argv) > 1:
         champion_name = sys.argv[1].lower()
     else:
         champion_name = input("Enter champion name: ").lower()
-        
-    get_runes_headless(champion_name) 
\ No newline at end of file
+    
+    # A running daemon already has a warm browser; otherwise scrape in-process
+    rune_data = fetch_from_daemon(champion_name)
+    if rune_data is None:
+        get_runes_headless(champion_name)
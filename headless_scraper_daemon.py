@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+import os
+import sys
+import time
+import logging
+import secrets
+import threading
+from multiprocessing.connection import AuthenticationError, Client, Listener, answer_challenge, deliver_challenge
+from headless_scraper import (DAEMON_ADDRESS, DAEMON_DIR, DAEMON_KEY_FILE, DAEMON_MAX_MESSAGE,
+                              get_runes_headless, json_dumps_bytes, json_loads, logger, scraper)
+
+# Shut down after this many seconds without a request
+IDLE_TIMEOUT = 1800
+# Drop clients that authenticate but send no request within this many seconds
+REQUEST_TIMEOUT = 30
+
+def _daemon_running():
+    """True if another daemon is already listening on DAEMON_ADDRESS"""
+    try:
+        Client(DAEMON_ADDRESS).close()
+        return True
+    except OSError:
+        return False
+
+def _publish_key():
+    """Write a fresh random authkey readable only by the current user"""
+    key = secrets.token_bytes(32)
+    tmp_file = DAEMON_KEY_FILE + ".tmp"
+    try:
+        os.remove(tmp_file)
+    except FileNotFoundError:
+        pass
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    os.replace(tmp_file, DAEMON_KEY_FILE)
+    return key
+
+def serve(idle_timeout=IDLE_TIMEOUT):
+    """
+    Keep a headless browser warm and answer {"champion": name} requests with
+    {"data": rune_data} or {"error": message}, until idle for idle_timeout seconds
+    """
+    os.makedirs(DAEMON_DIR, mode=0o700, exist_ok=True)
+    if sys.platform != "win32":
+        os.chmod(DAEMON_DIR, 0o700)
+        if os.path.exists(DAEMON_ADDRESS):
+            if _daemon_running():
+                logger.info("Scraper daemon is already running")
+                return
+            os.remove(DAEMON_ADDRESS)  # left behind by a daemon that did not exit cleanly
+    
+    try:
+        # Authentication happens per connection below, so a silent client cannot stall accept()
+        listener = Listener(DAEMON_ADDRESS)
+    except OSError as e:
+        logger.info(f"Scraper daemon is already running ({e})")
+        return
+    
+    authkey = _publish_key()
+    last_request = time.time()
+    stopping = threading.Event()
+    scrape_lock = threading.Lock()
+    
+    def handle(conn):
+        nonlocal last_request
+        with conn:
+            try:
+                deliver_challenge(conn, authkey)
+                answer_challenge(conn, authkey)
+                if not conn.poll(REQUEST_TIMEOUT):
+                    return
+                request = json_loads(conn.recv_bytes(DAEMON_MAX_MESSAGE))
+                champion_name = str(request["champion"]).lower()
+            except (AuthenticationError, OSError, EOFError, ValueError, KeyError, TypeError) as e:
+                logger.debug(f"Dropped daemon connection: {e}")
+                return
+            
+            # Cache and rune_data.json writes are not safe to interleave, so serve one at a time
+            with scrape_lock:
+                try:
+                    rune_data = get_runes_headless(champion_name)
+                    if rune_data and rune_data["primary_path"] and rune_data["keystone"] and rune_data["primary_runes"]:
+                        reply = {"data": rune_data}
+                    else:
+                        reply = {"error": f"No rune data found for {champion_name}"}
+                except Exception as e:
+                    logger.error(f"Error serving request: {e}")
+                    reply = {"error": str(e)}
+                last_request = time.time()
+            
+            try:
+                conn.send_bytes(json_dumps_bytes(reply))
+            except OSError:
+                pass
+    
+    def watch_idle():
+        while time.time() - last_request < idle_timeout:
+            time.sleep(min(60, idle_timeout))
+        logger.info("Scraper daemon idle, shutting down")
+        stopping.set()
+        # Wake the blocking accept() in the serving loop with a throwaway connection
+        try:
+            Client(DAEMON_ADDRESS).close()
+        except OSError:
+            pass
+    
+    threading.Thread(target=watch_idle, daemon=True).start()
+    logger.info(f"Scraper daemon listening on {DAEMON_ADDRESS}")
+    
+    try:
+        # Launch the shared browser now so the first request finds it warm
+        scraper.start()
+        while not stopping.is_set():
+            try:
+                conn = listener.accept()
+            except OSError as e:
+                # A client that connects and hangs up early only costs its own connection
+                if not stopping.is_set():
+                    logger.debug(f"Failed to accept daemon connection: {e}")
+                continue
+            if stopping.is_set():
+                conn.close()
+                break
+            threading.Thread(target=handle, args=(conn,), daemon=True).start()
+    finally:
+        try:
+            os.remove(DAEMON_KEY_FILE)
+        except OSError:
+            pass
+        listener.close()
+        scraper.close()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    serve(int(sys.argv[1]) if len(sys.argv) > 1 else IDLE_TIMEOUT)